@@ -2,18 +2,268 @@
 Data loading utilities for USCS cancer incidence data.
 """
 
+import functools
+import weakref
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    # read_csv(engine="pyarrow") needs pandas >= 1.4
+    _PANDAS_VERSION = tuple(int(v) for v in pd.__version__.split(".")[:2])
+    _CSV_ENGINE = "pyarrow" if _PANDAS_VERSION >= (1, 4) else "c"
+except ImportError:
+    _CSV_ENGINE = "c"
 
-def load_uscs_data(data_dir=None):
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+# Below this size numexpr's setup costs more than it saves (same cut-off
+# pandas uses for its own numexpr dispatch)
+_NUMEXPR_MIN_ELEMENTS = 10_000
+
+# Column types of the USCS ASCII tables; only these columns are loaded.
+# YEAR is read as text because it also holds multi-year ranges (e.g.
+# "2018-2022") and converted to a numeric year right after parsing, with
+# NaN for the ranges. COUNT/POPULATION are float64 so suppressed ("~")
+# cells become NaN.
+_BRAIN_DTYPES = {
+    "AGE": "category",
+    "BEHAVIOR": "category",
+    "EVENT_TYPE": "category",
+    "RACE": "category",
+    "SEX": "category",
+    "SITE": "category",
+    "YEAR": str,
+    "AGE_ADJUSTED_RATE": "float32",
+    "AGE_ADJUSTED_CI_LOWER": "float32",
+    "AGE_ADJUSTED_CI_UPPER": "float32",
+    "COUNT": "float64",
+    "POPULATION": "float64",
+}
+
+_BYAGE_DTYPES = {
+    "AGE": "category",
+    "EVENT_TYPE": "category",
+    "RACE": "category",
+    "SEX": "category",
+    "SITE": "category",
+    "YEAR": str,
+    "RATE": "float32",
+    "CI_LOWER": "float32",
+    "CI_UPPER": "float32",
+    "COUNT": "float64",
+    "POPULATION": "float64",
+}
+
+
+# Lookup order of the indexed BYAGE frame used by get_site_age_incidence
+_BYAGE_INDEX = ["EVENT_TYPE", "RACE", "SITE", "YEAR", "AGE"]
+
+# id(raw frame) -> weak reference, for BYAGE frames returned by load_uscs_data
+_OWNED_BYAGE = {}
+
+# id(raw frame) -> (weak reference to it, indexed frame); owned frames only
+_BYAGE_INDEX_CACHE = {}
+
+
+def _parse_uscs_csv(path, dtypes):
+    """
+    Parse a pipe-delimited USCS file with a fixed schema.
+    
+    Numeric columns that contain unexpected tokens are re-read as text and
+    coerced, so such values become NaN instead of failing the whole load.
+    """
+    header = pd.read_csv(path, sep="|", nrows=0).columns
+    usecols = [col for col in header if col in dtypes]
+    dtype = {col: dtypes[col] for col in usecols}
+    
+    if _CSV_ENGINE == "pyarrow":
+        kwargs = {"engine": "pyarrow"}
+    else:
+        kwargs = {"low_memory": False}
+    
+    try:
+        return pd.read_csv(path, sep="|", na_values="~", usecols=usecols, dtype=dtype, **kwargs)
+    except ValueError:
+        numeric = [col for col, t in dtype.items() if t in ("float32", "float64")]
+        # Numeric columns must be read explicitly as text: left to inference,
+        # the pyarrow engine types them again and fails on the same tokens
+        text_dtype = {col: (str if col in numeric else t) for col, t in dtype.items()}
+        df = pd.read_csv(path, sep="|", na_values="~", usecols=usecols, dtype=text_dtype, **kwargs)
+        for col in numeric:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype[col])
+        return df
+
+
+def _read_uscs_table(path, dtypes, use_cache=True):
+    """
+    Read a pipe-delimited USCS table, using the multi-threaded PyArrow
+    parser when available.
+    
+    When ``use_cache`` is True and pyarrow is available, the parsed table is
+    stored in a Parquet file next to the source (e.g. ``BYAGE.parquet``) and
+    reused on later calls as long as it is not older than the ASCII file.
+    """
+    path = Path(path)
+    cache = path.with_suffix(".parquet")
+    use_cache = use_cache and _CSV_ENGINE == "pyarrow"
+    
+    if use_cache and cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        df = pd.read_parquet(cache, engine="pyarrow")
+        # Caches written with a different schema are rebuilt below
+        if all(col in dtypes for col in df.columns) and (
+            "YEAR" not in df.columns or pd.api.types.is_numeric_dtype(df["YEAR"])
+        ):
+            return df
+    
+    df = _parse_uscs_csv(path, dtypes)
+    if "YEAR" in df.columns:
+        # Parse the year once here so downstream filters are numeric compares
+        df["YEAR"] = pd.to_numeric(df["YEAR"], errors="coerce")
+    
+    if use_cache:
+        try:
+            df.to_parquet(cache, engine="pyarrow", compression="zstd")
+        except OSError:
+            # Read-only data directory: keep working without the cache
+            pass
+    return df
+
+
+def _downcast(col):
+    """
+    ``downcast`` argument for ``pd.to_numeric`` on a USCS column.
+    
+    Rates and confidence limits fit in float32. COUNT and POPULATION stay
+    float64: they hold NaN for suppressed cells, and summing them in a
+    narrow dtype could lose precision.
+    """
+    return None if col in ("COUNT", "POPULATION") else "float"
+
+
+def _coerce_numeric(df, columns):
+    """
+    Numeric versions of those ``columns`` of ``df`` that are not numeric yet.
+    
+    Frames from :func:`load_uscs_data` are already typed, in which case this
+    returns an empty dict; text columns are coerced (NaN where unparseable).
+    """
+    return {
+        col: pd.to_numeric(df[col], errors="coerce", downcast=_downcast(col))
+        for col in columns
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+    }
+
+
+def _rate_per_100k(count, population):
+    """
+    Incidence rate per 100,000 as one fused expression (no temporaries).
+    """
+    count = np.asarray(count, dtype=np.float64)
+    population = np.asarray(population, dtype=np.float64)
+    if numexpr is not None and count.size >= _NUMEXPR_MIN_ELEMENTS:
+        return numexpr.evaluate("count / population * 100000.0")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.divide(count, population)
+    rate *= 100000.0
+    return rate
+
+
+def _equals(df, col, value):
+    """
+    Boolean mask (ndarray) of ``df[col] == value``.
+    
+    For categorical columns the value is resolved to its integer code once
+    and compared against the (int8/int16) codes array; other columns compare
+    the underlying array directly, skipping DataFrame-level overhead.
+    """
+    values = df[col].values
+    if isinstance(values, pd.Categorical):
+        if value not in values.categories:
+            return np.zeros(len(values), dtype=bool)
+        return values.codes == values.categories.get_loc(value)
+    return values == value
+
+
+def _group_codes(values):
+    """
+    Integer codes (-1 for missing) and sorted levels of a grouping column.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values, sort=True)
+
+
+def _sum_by_age_year(df, columns):
+    """
+    Sum ``columns`` of ``df`` per (AGE, YEAR) group.
+    
+    Equivalent to ``df.groupby(["AGE", "YEAR"], as_index=False, observed=True)
+    .agg("sum")`` but aggregates with ``np.bincount`` over integer group codes.
+    """
+    age_codes, age_levels = _group_codes(df["AGE"])
+    year_codes, year_levels = _group_codes(df["YEAR"])
+    n_years = len(year_levels)
+    n_groups = len(age_levels) * n_years
+    
+    # Rows with a missing key are dropped, as groupby does
+    valid = (age_codes >= 0) & (year_codes >= 0)
+    flat = age_codes[valid].astype(np.intp) * n_years + year_codes[valid]
+    
+    observed = np.flatnonzero(np.bincount(flat, minlength=n_groups))
+    agg = pd.DataFrame({
+        "AGE": np.asarray(age_levels)[observed // n_years],
+        "YEAR": np.asarray(year_levels)[observed % n_years],
+    })
+    for col in columns:
+        # NaN counts add nothing, matching groupby's skipna sum
+        values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64)
+        weights = np.nan_to_num(values[valid])
+        agg[col] = np.bincount(flat, weights=weights, minlength=n_groups)[observed]
+    return agg
+
+
+@functools.lru_cache(maxsize=4)
+def _load_uscs_cached(brain_by_site_path, by_age_path, mtimes, use_cache):
+    """
+    Parse both USCS tables; memoized on the resolved paths and their
+    modification times so edited files are picked up within a session.
+    """
+    # Load pipe-delimited files, "~" denotes missing values
+    brain_by_site = _read_uscs_table(brain_by_site_path, _BRAIN_DTYPES, use_cache=use_cache)
+    by_age = _read_uscs_table(by_age_path, _BYAGE_DTYPES, use_cache=use_cache)
+    
+    # Memoized frames are read-only by contract, so their index may be cached
+    key = id(by_age)
+    _OWNED_BYAGE[key] = weakref.ref(by_age, lambda _, key=key: _OWNED_BYAGE.pop(key, None))
+    
+    return brain_by_site, by_age
+
+
+def load_uscs_data(data_dir=None, use_cache=True):
     """
     Load USCS cancer incidence data from ASCII files.
     
+    Results are memoized per data directory, so repeated calls in the same
+    session return the same DataFrame objects without re-reading the files.
+    Do not modify them in place; take a ``.copy()`` first if needed.
+    
     Parameters
     ----------
     data_dir : str or Path, optional
         Path to the USCS data directory. If None, uses default relative path.
+    use_cache : bool, default=True
+        Reuse (or create) Parquet copies of the ASCII files in ``data_dir``
+        so that repeated loads skip CSV parsing.
     
     Returns
     -------
@@ -26,24 +276,11 @@ def load_uscs_data(data_dir=None):
     else:
         data_dir = Path(data_dir)
     
-    brain_by_site_path = data_dir / "BRAINBYSITE.TXT"
-    by_age_path = data_dir / "BYAGE.TXT"
+    brain_by_site_path = (data_dir / "BRAINBYSITE.TXT").resolve()
+    by_age_path = (data_dir / "BYAGE.TXT").resolve()
+    mtimes = (brain_by_site_path.stat().st_mtime, by_age_path.stat().st_mtime)
     
-    # Load pipe-delimited files, "~" denotes missing values
-    brain_by_site = pd.read_csv(
-        brain_by_site_path, 
-        sep="|", 
-        na_values="~",
-        low_memory=False
-    )
-    by_age = pd.read_csv(
-        by_age_path, 
-        sep="|", 
-        na_values="~",
-        low_memory=False
-    )
-    
-    return brain_by_site, by_age
+    return _load_uscs_cached(brain_by_site_path, by_age_path, mtimes, use_cache)
 
 
 def prepare_pediatric_brain_data(brain_by_site):
@@ -60,29 +297,30 @@ def prepare_pediatric_brain_data(brain_by_site):
     DataFrame
         Filtered and cleaned pediatric brain tumor data.
     """
-    df = brain_by_site.copy()
+    df = brain_by_site
     
-    # Ensure numeric columns are correctly typed
-    for col in ["AGE_ADJUSTED_RATE", "AGE_ADJUSTED_CI_LOWER", "AGE_ADJUSTED_CI_UPPER"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    for col in ["COUNT", "POPULATION"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    
-    # Focus on malignant brain tumors in children (0-19 years)
-    pediatric_brain = df[
-        (df["AGE"] == "0-19")
-        & (df["BEHAVIOR"] == "Malignant")
-    ].copy()
+    # Focus on malignant brain tumors in children (0-19 years), dropping rows
+    # where the age-adjusted rate is not reported
+    rate = pd.to_numeric(df["AGE_ADJUSTED_RATE"], errors="coerce")
+    pediatric_brain = df.loc[
+        _equals(df, "AGE", "0-19")
+        & _equals(df, "BEHAVIOR", "Malignant")
+        & rate.notna().values
+    ]
     
-    # Drop rows where the age-adjusted rate is not reported
-    pediatric_brain = pediatric_brain[pediatric_brain["AGE_ADJUSTED_RATE"].notna()].copy()
+    # Ensure numeric columns are correctly typed. assign() builds the result
+    # as a new frame, so the caller's raw data is never modified.
+    numeric = _coerce_numeric(
+        pediatric_brain,
+        ["AGE_ADJUSTED_RATE", "AGE_ADJUSTED_CI_LOWER", "AGE_ADJUSTED_CI_UPPER",
+         "COUNT", "POPULATION"],
+    )
     
     # Add YEAR as numeric for year-wise plots
-    pediatric_brain["YEAR_NUM"] = pd.to_numeric(pediatric_brain["YEAR"], errors="coerce")
-    
-    return pediatric_brain
+    return pediatric_brain.assign(
+        **numeric,
+        YEAR_NUM=pd.to_numeric(pediatric_brain["YEAR"], errors="coerce"),
+    )
 
 
 def prepare_all_sites_age_data(by_age):
@@ -99,32 +337,77 @@ def prepare_all_sites_age_data(by_age):
     DataFrame
         Filtered and cleaned age-specific incidence data.
     """
-    from .utils import age_group_to_start
+    from .utils import age_group_to_start_series
     
-    df = by_age.copy()
-    
-    # Make sure numeric columns are correctly typed
-    for col in ["CI_LOWER", "CI_UPPER", "COUNT", "POPULATION", "RATE"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = by_age
     
     # Focus on incidence, all races, all cancer sites combined
-    all_sites_age_inc = df[
-        (df["EVENT_TYPE"] == "Incidence")
-        & (df["RACE"] == "All Races")
-        & (df["SITE"] == "All Cancer Sites Combined")
-    ].copy()
+    all_sites_age_inc = df.loc[
+        _equals(df, "EVENT_TYPE", "Incidence")
+        & _equals(df, "RACE", "All Races")
+        & _equals(df, "SITE", "All Cancer Sites Combined")
+    ]
     
     # Add age start for ordering
-    all_sites_age_inc["AGE_START"] = all_sites_age_inc["AGE"].apply(age_group_to_start)
+    age_start = age_group_to_start_series(all_sites_age_inc["AGE"])
     
     # Remove "All Ages" and any age categories we cannot order
-    all_sites_age_inc = all_sites_age_inc[
-        all_sites_age_inc["AGE_START"].notna() 
-        & (all_sites_age_inc["AGE"] != "All Ages")
-    ]
+    keep = age_start.notna().values & ~_equals(all_sites_age_inc, "AGE", "All Ages")
+    all_sites_age_inc = all_sites_age_inc.loc[keep]
+    
+    # Make sure numeric columns are correctly typed
+    numeric = _coerce_numeric(
+        all_sites_age_inc, ["CI_LOWER", "CI_UPPER", "COUNT", "POPULATION", "RATE"]
+    )
+    
+    # assign() returns a new frame that the caller may modify freely
+    return all_sites_age_inc.assign(**numeric, AGE_START=age_start[keep])
+
+
+def build_byage_index(by_age):
+    """
+    Index BYAGE data for fast per-site lookups.
+    
+    Parameters
+    ----------
+    by_age : DataFrame
+        Raw BYAGE data.
     
-    return all_sites_age_inc
+    Returns
+    -------
+    DataFrame
+        ``by_age`` indexed by (EVENT_TYPE, RACE, SITE, YEAR, AGE) and sorted,
+        so that selecting one site is a binary search instead of a full scan.
+    """
+    return by_age.set_index(_BYAGE_INDEX).sort_index()
+
+
+def _get_byage_index(by_age):
+    """
+    Return the indexed form of ``by_age``, or None if it must be scanned.
+    
+    Only frames returned by :func:`load_uscs_data` (which must not be
+    modified in place) get a cached index, built once per frame. Any other
+    frame may change between calls, so no index is kept for it; callers
+    wanting the fast path pass :func:`build_byage_index` output instead.
+    """
+    if list(by_age.index.names) == _BYAGE_INDEX:
+        return by_age
+    
+    key = id(by_age)
+    owned = _OWNED_BYAGE.get(key)
+    if owned is None or owned() is not by_age:
+        return None
+    
+    cached = _BYAGE_INDEX_CACHE.get(key)
+    if cached is not None and cached[0]() is by_age:
+        return cached[1]
+    
+    indexed = build_byage_index(by_age)
+    # Drop the entry once the raw frame is garbage collected
+    ref = weakref.ref(by_age, lambda _, key=key: _BYAGE_INDEX_CACHE.pop(key, None))
+    _BYAGE_INDEX_CACHE[key] = (ref, indexed)
+    return indexed
 
 
 def get_site_age_incidence(by_age, site_name, target_year=2020):
@@ -137,7 +420,7 @@ def get_site_age_incidence(by_age, site_name, target_year=2020):
     Parameters
     ----------
     by_age : DataFrame
-        Raw BYAGE data.
+        Raw BYAGE data, or the output of :func:`build_byage_index`.
     site_name : str
         Site name as recorded in the USCS BYAGE table
         (e.g., "Colon and Rectum", "Lung and Bronchus").
@@ -152,39 +435,70 @@ def get_site_age_incidence(by_age, site_name, target_year=2020):
         - rates: numpy array of incidence rates (per 100,000)
         - df_year: filtered DataFrame for the specified year and site
     """
-    from .utils import age_group_to_mid
+    from .utils import select_age_curve
 
-    df = by_age.copy()
-    # Filter by event type, race, and site; keep all sexes, aggregate later
-    df_site = df[
-        (df["EVENT_TYPE"] == "Incidence")
-        & (df["RACE"] == "All Races")
-        & (df["SITE"] == site_name)
-    ].copy()
+    indexed = _get_byage_index(by_age)
+    # Look up event type, race, and site; keep all sexes, aggregate later
+    if indexed is None:
+        df_site = by_age.loc[
+            _equals(by_age, "EVENT_TYPE", "Incidence")
+            & _equals(by_age, "RACE", "All Races")
+            & _equals(by_age, "SITE", site_name)
+        ]
+    else:
+        try:
+            df_site = indexed.loc[("Incidence", "All Races", site_name)].reset_index()
+        except KeyError:
+            return None, None, indexed.iloc[:0].reset_index()
 
     if df_site.empty:
         return None, None, df_site
 
-    # Ensure numeric
-    for col in ["COUNT", "POPULATION"]:
-        if col in df_site.columns:
-            df_site[col] = pd.to_numeric(df_site[col], errors="coerce")
+    # Caller frames may hold YEAR as text; compare its numeric value
+    year = _coerce_numeric(df_site, ["YEAR"]).get("YEAR", df_site["YEAR"])
+    df_site = df_site.loc[year.eq(target_year).to_numpy(dtype=bool, na_value=False)]
 
     # Aggregate over sex: sum counts and population by AGE and YEAR
-    agg = (
-        df_site
-        .groupby(["AGE", "YEAR"], as_index=False)
-        .agg({"COUNT": "sum", "POPULATION": "sum"})
-    )
-    agg["RATE"] = agg["COUNT"] / agg["POPULATION"] * 100000.0
-    agg["AGE_MID"] = agg["AGE"].apply(age_group_to_mid)
-    agg = agg[agg["AGE_MID"].notna()].copy()
-
-    df_year = agg[pd.to_numeric(agg["YEAR"], errors="coerce") == target_year].copy()
-    df_year = df_year.sort_values("AGE_MID")
+    agg = _sum_by_age_year(df_site, ["COUNT", "POPULATION"])
+    agg["RATE"] = _rate_per_100k(agg["COUNT"], agg["POPULATION"])
 
-    ages = df_year["AGE_MID"].values
-    rates = df_year["RATE"].values
+    return select_age_curve(agg, target_year)
 
-    return ages, rates, df_year
 
+def get_site_age_incidence_batch(by_age, site_names, target_year=2020, n_jobs=-1):
+    """
+    Run :func:`get_site_age_incidence` for several cancer sites in parallel.
+    
+    Parameters
+    ----------
+    by_age : DataFrame
+        Raw BYAGE data, or the output of :func:`build_byage_index`.
+    site_names : list of str
+        Site names as recorded in the USCS BYAGE table.
+    target_year : int, default=2020
+        Calendar year to extract.
+    n_jobs : int, default=-1
+        Number of worker threads (-1 uses all cores). Sites are processed
+        one after another if joblib is not installed.
+    
+    Returns
+    -------
+    dict
+        Maps each site name to the ``(ages, rates, df_year)`` tuple returned
+        by :func:`get_site_age_incidence`.
+    """
+    # Build the shared index once, before the workers start; frames not
+    # owned by this module get a fresh index that lives only for this call
+    indexed = _get_byage_index(by_age)
+    if indexed is None:
+        indexed = build_byage_index(by_age)
+    
+    if Parallel is None:
+        results = [get_site_age_incidence(indexed, site, target_year) for site in site_names]
+    else:
+        # Threads share the indexed frame without pickling it
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(get_site_age_incidence)(indexed, site, target_year)
+            for site in site_names
+        )
+    return dict(zip(site_names, results))
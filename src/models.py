@@ -2,9 +2,88 @@
 Probabilistic mutation-accumulation models for cancer risk analysis.
 """
 
+import math
 import numpy as np
-import pandas as pd
-from .utils import age_group_to_mid
+from .utils import select_age_curve
+
+try:
+    from scipy.stats import poisson
+except ImportError:
+    poisson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Maximum number of (ages, parameters) results kept per model instance
+_PREDICT_CACHE_SIZE = 32
+
+
+def _poisson_sf_kernel(lam, k):
+    """
+    Manual Poisson tail P(X >= k) for a 1-D array of lam, one native loop
+    per element when compiled with numba.
+    """
+    out = np.empty_like(lam)
+    for j in range(lam.size):
+        term = math.exp(-lam[j])
+        prob_sum = term
+        for i in range(1, k):
+            term *= lam[j] / i
+            prob_sum += term
+        out[j] = 1.0 - prob_sum
+    return out
+
+
+def _single_hit_kernel(ages, factor):
+    """
+    Single-hit tissue probability -expm1(a * factor) for a 1-D array of ages,
+    fused into one native loop when compiled with numba.
+    """
+    out = np.empty_like(ages)
+    for i in range(ages.size):
+        out[i] = -math.expm1(ages[i] * factor)
+    return out
+
+
+def _single_hit_sweep(ages, factors):
+    """
+    Single-hit probabilities for a grid of factors x ages; rows are
+    independent and are spread over threads when compiled with numba.
+    """
+    out = np.empty((factors.size, ages.size))
+    for i in prange(factors.size):
+        for j in range(ages.size):
+            out[i, j] = -math.expm1(ages[j] * factors[i])
+    return out
+
+
+if njit is not None:
+    _poisson_sf_kernel = njit(cache=True, fastmath=True)(_poisson_sf_kernel)
+    _single_hit_kernel = njit(cache=True, fastmath=True)(_single_hit_kernel)
+    _single_hit_sweep = njit(parallel=True, cache=True, fastmath=True)(_single_hit_sweep)
+
+
+def _poisson_sf(k, lam):
+    """
+    P(X >= k) for X ~ Poisson(lam), evaluated elementwise over an array of lam.
+    """
+    if poisson is not None:
+        return poisson.sf(k - 1, lam)
+    if njit is not None:
+        lam = np.asarray(lam, dtype=np.float64)
+        return _poisson_sf_kernel(np.ravel(lam), k).reshape(lam.shape)
+    
+    # Manual Poisson CDF: P(X >= k) = 1 - sum_{i=0}^{k-1} exp(-lambda) * lambda^i / i!
+    # The recurrence runs over i only; each step is one array operation over lam.
+    term = np.exp(-lam)
+    prob_sum = term.copy()
+    for i in range(1, k):
+        term = term * lam / i
+        prob_sum += term
+    return 1 - prob_sum
 
 
 class MutationAccumulationModel:
@@ -51,44 +130,21 @@ class MutationAccumulationModel:
         self.divisions_per_year = divisions_per_year
         self.C = C
         self.r = r
+        self._log1m_p_key = None
+        self._log1m_p = None
+        self._cache = {}
     
-    def _binomial_probability(self, n, k, p):
+    def _log1m_p_eff(self):
         """
-        Calculate binomial probability P(X >= k) for n trials with success probability p.
-        Uses Poisson approximation for large n and small p.
+        Return log(1 - p_eff), recomputed only when p or r has changed.
         """
-        if k == 1:
-            # Single hit case: use exact formula
-            return 1 - (1 - p) ** n
-        elif k > n:
-            return 0.0
-        else:
-            # Multiple hits: use Poisson approximation for computational efficiency
-            # When p is small and n is large, Binomial(n,p) ≈ Poisson(np)
-            lambda_poisson = n * p
-            if lambda_poisson < 1e-10:
-                return 0.0
-            
-            # Calculate P(X >= k) using Poisson distribution
-            # Try scipy first, fall back to manual calculation
-            try:
-                from scipy.stats import poisson
-                return 1 - poisson.cdf(k - 1, lambda_poisson)
-            except ImportError:
-                # Manual Poisson CDF calculation using recurrence relation
-                # P(X >= k) = 1 - sum_{i=0}^{k-1} exp(-lambda) * lambda^i / i!
-                prob_sum = 0.0
-                exp_neg_lambda = np.exp(-lambda_poisson)
-                factorial = 1.0
-                lambda_power = 1.0
-                
-                for i in range(k):
-                    if i > 0:
-                        factorial *= i
-                        lambda_power *= lambda_poisson
-                    prob_sum += exp_neg_lambda * lambda_power / factorial
-                
-                return 1 - prob_sum
+        key = (self.p, self.r)
+        if key != self._log1m_p_key:
+            # Apply repair efficiency
+            p_eff = self.p * (1 - self.r)
+            self._log1m_p = np.log1p(-p_eff)
+            self._log1m_p_key = key
+        return self._log1m_p
     
     def predict(self, ages):
         """
@@ -104,27 +160,63 @@ class MutationAccumulationModel:
         array
             Predicted probabilities of malignancy.
         """
-        ages = np.asarray(ages)
-        # Apply repair efficiency
-        p_eff = self.p * (1 - self.r)
-        
-        # Calculate number of divisions
-        N = ages * self.divisions_per_year
-        
-        # Calculate probability that a single clone has >=C driver hits
+        # Hand out a copy so callers cannot modify the cached result
+        return self._predict_cached(ages).copy()
+    
+    def _predict_cached(self, ages):
+        """Return the cached prediction array for ages; must not be modified."""
+        ages = np.asarray(ages, dtype=np.float64)
+        key = (
+            ages.tobytes(), ages.shape,
+            self.p, self.M, self.divisions_per_year, self.C, self.r,
+        )
+        P_tissue = self._cache.get(key)
+        if P_tissue is None:
+            if len(self._cache) >= _PREDICT_CACHE_SIZE:
+                self._cache.clear()
+            P_tissue = self._cache[key] = self._compute(ages)
+        return P_tissue
+    
+    def _compute(self, ages):
+        """Evaluate the model for an ndarray of ages (uncached)."""
+        # Calculate probability that a single clone has >=C driver hits.
+        # 1 - (1 - x)^n is evaluated as -expm1(n * log1p(-x)), which avoids
+        # cancellation for the tiny probabilities used here.
         if self.C == 1:
-            # Single hit: use exact formula
-            p_cell = 1 - (1 - p_eff) ** N
+            # Single hit: 1 - (1 - p_cell)^M with p_cell = 1 - (1 - p)^N
+            # collapses to 1 - (1 - p)^(N*M), i.e. one scaled expm1 over ages
+            factor = self.divisions_per_year * self.M * self._log1m_p_eff()
+            if njit is not None:
+                return _single_hit_kernel(np.ravel(ages), factor).reshape(ages.shape)
+            P_tissue = np.empty_like(ages)
+            np.multiply(ages, factor, out=P_tissue)
         else:
-            # Multiple hits: use binomial/Poisson approximation
-            p_cell = np.array([self._binomial_probability(int(n), self.C, p_eff) 
-                              for n in N])
+            # Apply repair efficiency
+            p_eff = self.p * (1 - self.r)
+            
+            # Calculate number of divisions
+            N = ages * self.divisions_per_year
+            
+            # Multiple hits: Binomial(n, p) ≈ Poisson(n * p) for small p, large n
+            n = np.floor(N)
+            lambda_poisson = n * p_eff
+            p_cell = np.where(
+                (n < self.C) | (lambda_poisson < 1e-10),
+                0.0,
+                _poisson_sf(self.C, lambda_poisson),
+            )
+            
+            # Calculate tissue-level probability
+            P_tissue = np.empty_like(ages)
+            with np.errstate(divide="ignore"):
+                np.log1p(-p_cell, out=P_tissue)
+            P_tissue *= self.M
         
-        # Calculate tissue-level probability
-        P_tissue = 1 - (1 - p_cell) ** self.M
+        np.expm1(P_tissue, out=P_tissue)
+        np.negative(P_tissue, out=P_tissue)
         return P_tissue
     
-    def predict_scaled(self, ages, scale_to_max=None):
+    def predict_scaled(self, ages, scale_to_max=None, out=None):
         """
         Predict cancer risk scaled to match empirical incidence scale.
         
@@ -134,22 +226,97 @@ class MutationAccumulationModel:
             Ages in years.
         scale_to_max : float, optional
             Maximum value to scale to. If None, returns unscaled predictions.
+        out : array, optional
+            Preallocated float64 array of the same shape as ages to write
+            the result into.
         
         Returns
         -------
         array
-            Scaled predicted probabilities.
+            Scaled predicted probabilities (``out`` when given).
         """
-        P_tissue = self.predict(ages)
+        if out is None:
+            # predict() returns a fresh array, so it can be rescaled in place
+            P_tissue = out = self.predict(ages)
+        else:
+            P_tissue = self._predict_cached(ages)
+        
         if scale_to_max is not None:
             max_val = P_tissue.max()
             if max_val > 0:
-                P_scaled = P_tissue / max_val * scale_to_max
+                np.multiply(P_tissue, scale_to_max / max_val, out=out)
             else:
                 # If all predictions are zero (shouldn't happen in practice), return zeros
-                P_scaled = np.zeros_like(P_tissue)
-            return P_scaled
-        return P_tissue
+                out[...] = 0.0
+        elif out is not P_tissue:
+            out[...] = P_tissue
+        return out
+    
+    def set_param(self, name, value):
+        """
+        Set one model parameter in place.
+        
+        Parameters
+        ----------
+        name : str
+            Parameter name ('p', 'M', 'divisions_per_year', 'C' or 'r').
+        value : float or int
+            New value.
+        """
+        if name not in self.get_parameters():
+            raise ValueError(f"Unknown parameter: {name}")
+        setattr(self, name, value)
+    
+    def predict_sweep(self, ages, param_name, param_values):
+        """
+        Predict cancer risk for several values of one parameter.
+        
+        All other parameters are held at this model's values. Single-hit
+        sweeps are evaluated as one 2-D grid instead of one model per value.
+        
+        Parameters
+        ----------
+        ages : array-like
+            Ages in years.
+        param_name : str
+            Name of the parameter to vary ('p', 'M', 'divisions_per_year', 'C' or 'r').
+        param_values : list
+            Values to evaluate.
+        
+        Returns
+        -------
+        array
+            Predictions of shape (len(param_values),) + ages.shape; row i
+            uses param_name = param_values[i].
+        """
+        ages = np.asarray(ages, dtype=np.float64)
+        params = self.get_parameters()
+        if param_name not in params:
+            raise ValueError(f"Unknown parameter: {param_name}")
+        sweep = [dict(params, **{param_name: value}) for value in param_values]
+        if not sweep:
+            return np.empty((0,) + ages.shape)
+        
+        if all(q["C"] == 1 for q in sweep):
+            # Single hit: each row is -expm1(ages * factor), see _compute()
+            factors = np.array([
+                q["divisions_per_year"] * q["M"] * np.log1p(-q["p"] * (1 - q["r"]))
+                for q in sweep
+            ], dtype=np.float64)
+            flat = np.ravel(ages)
+            if njit is not None:
+                out = _single_hit_sweep(flat, factors)
+            else:
+                out = -np.expm1(np.multiply.outer(factors, flat))
+            return out.reshape((len(sweep),) + ages.shape)
+        
+        # Multi-hit sweeps: reuse one model and fill a preallocated result
+        model = type(self)(**params)
+        out = np.empty((len(sweep),) + ages.shape)
+        for i, value in enumerate(param_values):
+            model.set_param(param_name, value)
+            out[i] = model._predict_cached(ages)
+        return out
     
     def get_parameters(self):
         """Return model parameters as a dictionary."""
@@ -178,17 +345,5 @@ def prepare_age_incidence_data(all_sites_age_inc, target_year=2020):
     tuple
         (ages, rates) arrays of age midpoints and incidence rates.
     """
-    age_model_df = all_sites_age_inc.copy()
-    age_model_df["AGE_MID"] = age_model_df["AGE"].apply(age_group_to_mid)
-    age_model_df = age_model_df[age_model_df["AGE_MID"].notna()].copy()
-    
-    age_year_df = age_model_df[
-        pd.to_numeric(age_model_df["YEAR"], errors="coerce") == target_year
-    ].copy()
-    age_year_df = age_year_df.sort_values("AGE_MID")
-    
-    ages = age_year_df["AGE_MID"].values
-    rates = age_year_df["RATE"].values
-    
+    ages, rates, _ = select_age_curve(all_sites_age_inc[["AGE", "YEAR", "RATE"]], target_year)
     return ages, rates
-
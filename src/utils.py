@@ -7,6 +7,18 @@ import pandas as pd
 import numpy as np
 
 
+# Age groups used by the USCS/SEER tables; looked up directly instead of parsed
+_KNOWN_RANGES = [(1, 4)] + [(lo, lo + 4) for lo in range(5, 85, 5)]
+
+_AGE_START = {f"{lo}-{hi}": float(lo) for lo, hi in _KNOWN_RANGES}
+_AGE_START["85+"] = 85.0
+_AGE_START["All Ages"] = -1
+
+_AGE_MID = {f"{lo}-{hi}": (lo + hi) / 2.0 for lo, hi in _KNOWN_RANGES}
+_AGE_MID["85+"] = 87.5
+_AGE_MID["All Ages"] = np.nan
+
+
 def age_group_to_start(age_str):
     """
     Convert age group string (e.g., "1-4", "70-74", "85+") to starting age.
@@ -24,6 +36,9 @@ def age_group_to_start(age_str):
     if pd.isna(age_str):
         return math.nan
     if isinstance(age_str, str):
+        start = _AGE_START.get(age_str)
+        if start is not None:
+            return start
         age_str = age_str.strip()
         if age_str == "All Ages":
             return -1
@@ -56,6 +71,9 @@ def age_group_to_mid(age_str):
     """
     if pd.isna(age_str):
         return np.nan
+    mid = _AGE_MID.get(age_str) if isinstance(age_str, str) else None
+    if mid is not None:
+        return mid
     age_str = str(age_str).strip()
     if age_str == "All Ages":
         return np.nan
@@ -73,3 +91,125 @@ def age_group_to_mid(age_str):
             return np.nan
     return np.nan
 
+
+def _parse_age_start(s):
+    """Starting ages for an object Series of age group strings."""
+    s = s.str.strip()
+    is_plus = s.str.endswith("+").fillna(False).astype(bool)
+    is_range = ~is_plus & s.str.contains("-", regex=False).fillna(False).astype(bool)
+    
+    plus_start = pd.to_numeric(s.str.rstrip("+").where(is_plus), errors="coerce")
+    range_start = pd.to_numeric(s.str.split("-", n=1).str[0].where(is_range), errors="coerce")
+    
+    start = np.where(is_plus, plus_start, np.where(is_range, range_start, np.nan))
+    start[(s == "All Ages").to_numpy()] = -1
+    return start
+
+
+def _parse_age_mid(s):
+    """Midpoint ages for an object Series of age group strings."""
+    s = s.str.strip()
+    is_plus = s.str.endswith("+").fillna(False).astype(bool)
+    is_range = ~is_plus & s.str.contains("-", regex=False).fillna(False).astype(bool)
+    
+    # assume 5-year width for open-ended group
+    plus_mid = pd.to_numeric(s.str.rstrip("+").where(is_plus), errors="coerce") + 2.5
+    
+    # "lo-hi" must split into exactly two numbers
+    parts = s.where(is_range).str.split("-")
+    two_parts = (parts.str.len() == 2).to_numpy()
+    lo = pd.to_numeric(parts.str[0], errors="coerce").to_numpy(dtype="float64")
+    hi = pd.to_numeric(parts.str[1], errors="coerce").to_numpy(dtype="float64")
+    range_mid = np.where(two_parts, (lo + hi) / 2.0, np.nan)
+    
+    return np.where(is_plus, plus_mid, np.where(is_range, range_mid, np.nan))
+
+
+def _map_age_groups(age_groups, lookup, parse):
+    """
+    Resolve the distinct age groups through ``lookup``, fall back to
+    ``parse`` for unknown ones, and broadcast the result back to every row
+    via the integer codes.
+    """
+    if isinstance(age_groups.dtype, pd.CategoricalDtype):
+        codes = age_groups.cat.codes.to_numpy()
+        uniques = age_groups.cat.categories
+    else:
+        codes, uniques = pd.factorize(age_groups)
+    
+    uniques = pd.Series(uniques, dtype=object)
+    values = uniques.map(lookup).to_numpy(dtype="float64", copy=True)
+    unknown = ~uniques.isin(lookup.keys()).to_numpy()
+    if unknown.any():
+        values[unknown] = parse(uniques[unknown])
+    
+    # Code -1 (missing) picks up the trailing NaN
+    values = np.append(values, np.nan)
+    return pd.Series(values[codes], index=age_groups.index, dtype="float64")
+
+
+def age_group_to_start_series(age_groups):
+    """
+    Vectorized version of :func:`age_group_to_start` for a Series.
+    
+    Parameters
+    ----------
+    age_groups : Series
+        Age group strings (object, string or categorical dtype).
+    
+    Returns
+    -------
+    Series
+        Starting ages as float64 with the same index; NaN where the group
+        cannot be parsed and -1 for "All Ages".
+    """
+    return _map_age_groups(age_groups, _AGE_START, _parse_age_start)
+
+
+def age_group_to_mid_series(age_groups):
+    """
+    Vectorized version of :func:`age_group_to_mid` for a Series.
+    
+    Parameters
+    ----------
+    age_groups : Series
+        Age group strings (object, string or categorical dtype).
+    
+    Returns
+    -------
+    Series
+        Midpoint ages as float64 with the same index; NaN for "All Ages"
+        and groups that cannot be parsed.
+    """
+    return _map_age_groups(age_groups, _AGE_MID, _parse_age_mid)
+
+
+def select_age_curve(df, target_year):
+    """
+    Extract the age-incidence curve of one calendar year.
+    
+    Parameters
+    ----------
+    df : DataFrame
+        Age-specific incidence data with AGE, YEAR and RATE columns. A
+        non-numeric YEAR is coerced (unparseable years never match).
+    target_year : int
+        Calendar year to extract.
+    
+    Returns
+    -------
+    tuple
+        (ages, rates, df_year) where ages and rates are arrays ordered by age
+        midpoint and df_year holds the selected rows with an AGE_MID column.
+    """
+    age_mid = age_group_to_mid_series(df["AGE"])
+    year = df["YEAR"]
+    if not pd.api.types.is_numeric_dtype(year):
+        # Caller frames may hold YEAR as text, e.g. from a plain read_csv
+        year = pd.to_numeric(year, errors="coerce")
+    keep = age_mid.notna().to_numpy() & year.eq(target_year).to_numpy(dtype=bool, na_value=False)
+    
+    df_year = df.loc[keep].assign(AGE_MID=age_mid[keep])
+    df_year = df_year.sort_values("AGE_MID")
+    
+    return df_year["AGE_MID"].values, df_year["RATE"].values, df_year
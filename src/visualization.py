@@ -2,18 +2,221 @@
 Visualization utilities for cancer incidence analysis.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import functools
+import os
+
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# matplotlib.pyplot and seaborn, bound on first use by _lazy_imports()
+plt = None
+sns = None
+
+# Figures reused across plot_* calls when GIS_REUSE_FIG=1, keyed by figsize
+_FIG_CACHE = {}
+
+# Box plot line color matching seaborn's default boxplot styling
+_BOX_LINE_COLOR = ".26"
+
+# Residual sign colors: overestimates (0) red, underestimates (1) purple
+_RESIDUAL_COLORS = ["red", "purple"]
+
+
+def _lazy_imports():
+    """
+    Import matplotlib.pyplot and seaborn on first use and apply the default
+    style, so importing this module stays cheap for code that never plots.
+    """
+    global plt, sns
+    if plt is None:
+        import matplotlib.pyplot as _plt
+        import seaborn as _sns
+        
+        # Set default style
+        _sns.set(style="whitegrid", context="notebook")
+        _plt.rcParams["figure.figsize"] = (6, 4)
+        plt, sns = _plt, _sns
+    return plt, sns
+
+
+def _lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: indices of ``n_out`` points of the
+    x-sorted series (x, y) that preserve its visual shape. The first and last
+    points are always kept.
+    """
+    n = x.size
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+        
+        # Keep the point of the current bucket spanning the largest triangle
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best = start
+        max_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                best = j
+        idx[i + 1] = best
+        a = best
+    return idx
+
+
+if njit is not None:
+    _lttb_indices = njit(cache=True)(_lttb_indices)
+
+
+def _downsample_indices(x, y, max_points):
+    """
+    Positions in (x, y) of the points LTTB keeps, ordered by x.
+    
+    Returns ``slice(None)`` (every point, original order) for series at or
+    below ``max_points`` and for max_points=None, so the result can index
+    any array aligned with x.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if max_points is None or max_points < 3 or x.size <= max_points:
+        return slice(None)
+    if np.any(x[1:] < x[:-1]):
+        order = np.argsort(x, kind="stable")
+        return order[_lttb_indices(x[order], y[order], max_points)]
+    return _lttb_indices(x, y, max_points)
+
+
+def _downsample(x, y, max_points):
+    """
+    Reduce (x, y) to at most ``max_points`` points with LTTB before drawing.
+    
+    Series at or below the limit, and max_points=None, are returned unchanged.
+    Longer series are ordered by x first.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = _downsample_indices(x, y, max_points)
+    return x[keep], y[keep]
+
+
+@functools.lru_cache(maxsize=32)
+def _cmap_colors(name, n):
+    """
+    RGBA colors of ``n`` points evenly spaced over colormap ``name``, as a
+    tuple of tuples so the cached value cannot be modified.
+    """
+    return tuple(map(tuple, plt.get_cmap(name)(np.linspace(0, 1, n))))
+
+
+def _box_stats(sorted_vals):
+    """
+    Tukey box-plot summary (1.5 IQR whiskers) of an ascending 1-D array, in
+    the dict layout expected by ``Axes.bxp``.
+    """
+    q1, med, q3 = np.percentile(sorted_vals, [25, 50, 75])
+    iqr = q3 - q1
+    lo = np.searchsorted(sorted_vals, q1 - 1.5 * iqr, side="left")
+    hi = np.searchsorted(sorted_vals, q3 + 1.5 * iqr, side="right")
+    return {
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "whislo": min(sorted_vals[lo], q1),
+        "whishi": max(sorted_vals[hi - 1], q3),
+        "fliers": np.concatenate([sorted_vals[:lo], sorted_vals[hi:]]),
+    }
+
+
+def _get_fig(figsize):
+    """
+    Return (fig, ax) from the figure cache: a previously created figure of
+    this size, cleared down to a single empty Axes, or a new one.
+    """
+    key = tuple(figsize if figsize is not None else plt.rcParams["figure.figsize"])
+    fig = _FIG_CACHE.get(key)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig, ax = plt.subplots(figsize=key)
+        _FIG_CACHE[key] = fig
+        return fig, ax
+    fig.clear()
+    plt.figure(fig.number)
+    return fig, fig.add_subplot()
+
+
+def _get_ax(ax, figsize=None):
+    """
+    Return (fig, ax), creating a new figure of ``figsize`` when ax is None.
+    
+    With the environment variable GIS_REUSE_FIG=1 the figure is taken from
+    a module-level cache instead, so repeated calls share one canvas.
+    """
+    if ax is None:
+        if os.environ.get("GIS_REUSE_FIG") == "1":
+            return _get_fig(figsize)
+        return plt.subplots(figsize=figsize)
+    return ax.figure, ax
 
-# Set default style
-sns.set(style="whitegrid", context="notebook")
-plt.rcParams["figure.figsize"] = (6, 4)
 
+# Backends that render to files only; showing a figure on them is a no-op
+_NON_GUI_BACKENDS = ("agg", "cairo", "pdf", "pgf", "ps", "svg", "template")
 
-def plot_pediatric_brain_distribution(pediatric_brain):
+
+def _maybe_show():
+    """
+    Call ``plt.show()`` unless a file-only backend is active.
+    
+    Batch runs (scripts, report generation, CI) can set ``MPLBACKEND=Agg`` to
+    skip the show call and backend event-loop handling entirely. Returns
+    whether ``plt.show()`` was called.
+    """
+    if plt.get_backend().lower() in _NON_GUI_BACKENDS:
+        return False
+    plt.show()
+    return True
+
+
+def _finish_figure(fig, show, owns_fig):
+    """
+    Lay out ``fig`` and optionally show it.
+    
+    ``owns_fig`` tells whether the plot function created ``fig`` itself.
+    Figures passed in by the caller (through ``ax``) are left alone unless
+    ``show`` is set: no layout change, no show and never closed. Created
+    figures are shown by default (``show=None``).
+    
+    A figure that was shown is not returned, so a plot call ending a
+    notebook cell is not displayed a second time. It is closed only when
+    ``plt.show()`` actually ran outside interactive mode; on file-only
+    backends it stays current for a following ``plt.savefig()``.
+    """
+    if show is None:
+        show = owns_fig
+    if owns_fig:
+        fig.tight_layout()
+    if not show:
+        return fig
+    if _maybe_show():
+        # Cached figures stay open so the next call can reuse them
+        if owns_fig and not plt.isinteractive() and fig not in _FIG_CACHE.values():
+            plt.close(fig)
+    return None
+
+
+def plot_pediatric_brain_distribution(pediatric_brain, ax=None, show=None):
     """
     Plot distribution of pediatric malignant brain tumor incidence rates.
     
@@ -21,15 +224,32 @@ def plot_pediatric_brain_distribution(pediatric_brain):
     ----------
     pediatric_brain : DataFrame
         Pediatric brain tumor data.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
-    sns.histplot(pediatric_brain["AGE_ADJUSTED_RATE"].dropna(), bins=30)
-    plt.xlabel("Age-adjusted incidence rate (per 100,000)")
-    plt.title("Distribution of pediatric malignant brain tumor incidence rates (all years)")
-    plt.tight_layout()
-    plt.show()
+    _lazy_imports()
+    vals = pediatric_brain["AGE_ADJUSTED_RATE"].to_numpy(np.float64)
+    counts, edges = np.histogram(vals[~np.isnan(vals)], bins=30)
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color="C0", alpha=0.75, edgecolor="white", linewidth=0.5)
+    ax.set_ylabel("Count")
+    ax.set_xlabel("Age-adjusted incidence rate (per 100,000)")
+    ax.set_title("Distribution of pediatric malignant brain tumor incidence rates (all years)")
+    return _finish_figure(fig, show, owns_fig)
 
 
-def plot_pediatric_brain_by_year(pediatric_brain):
+def plot_pediatric_brain_by_year(pediatric_brain, ax=None, show=None):
     """
     Plot year-wise distribution of pediatric brain tumor incidence rates.
     
@@ -37,24 +257,64 @@ def plot_pediatric_brain_by_year(pediatric_brain):
     ----------
     pediatric_brain : DataFrame
         Pediatric brain tumor data with YEAR_NUM column.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
-    plt.figure(figsize=(10, 4))
-    order_years = sorted(pediatric_brain["YEAR_NUM"].dropna().unique())
-    sns.boxplot(
-        data=pediatric_brain[pediatric_brain["YEAR_NUM"].notna()],
-        x="YEAR_NUM",
-        y="AGE_ADJUSTED_RATE",
-        order=order_years,
-    )
-    plt.xticks(rotation=90)
-    plt.xlabel("Year")
-    plt.ylabel("Age-adjusted incidence rate (per 100,000)")
-    plt.title("Year-wise distribution of pediatric malignant brain tumor incidence rates")
-    plt.tight_layout()
-    plt.show()
+    _lazy_imports()
+    mask = pediatric_brain["YEAR_NUM"].notna()
+    years = pediatric_brain.loc[mask, "YEAR_NUM"].to_numpy(np.float64)
+    rates = pediatric_brain.loc[mask, "AGE_ADJUSTED_RATE"].to_numpy(np.float64)
+    order_years = np.unique(years)
+    
+    # One sort by (year, rate) leaves each year's rates as an ascending run
+    valid = ~np.isnan(rates)
+    order = np.lexsort((rates[valid], years[valid]))
+    years, rates = years[valid][order], rates[valid][order]
+    starts = np.searchsorted(years, order_years, side="left")
+    ends = np.searchsorted(years, order_years, side="right")
+    
+    stats, positions = [], []
+    for pos, (lo, hi) in enumerate(zip(starts, ends)):
+        if hi > lo:
+            stats.append(_box_stats(rates[lo:hi]))
+            positions.append(pos)
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(10, 4))
+    # Without any rates there is nothing to draw; keep the empty axes
+    if stats:
+        line = dict(color=_BOX_LINE_COLOR)
+        ax.bxp(
+            stats,
+            positions=positions,
+            widths=0.8,
+            patch_artist=True,
+            boxprops=dict(facecolor=sns.desaturate("C0", 0.75), edgecolor=_BOX_LINE_COLOR),
+            whiskerprops=line,
+            capprops=line,
+            medianprops=line,
+            flierprops=dict(marker="o", markerfacecolor="none", markeredgecolor=_BOX_LINE_COLOR),
+        )
+        ax.set_xlim(-0.5, len(order_years) - 0.5)
+    ax.set_xticks(range(len(order_years)))
+    ax.set_xticklabels([str(y) for y in order_years])
+    ax.grid(False, axis="x")
+    ax.tick_params(axis="x", labelrotation=90)
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Age-adjusted incidence rate (per 100,000)")
+    ax.set_title("Year-wise distribution of pediatric malignant brain tumor incidence rates")
+    return _finish_figure(fig, show, owns_fig)
 
 
-def plot_pediatric_brain_trend(pediatric_brain):
+def plot_pediatric_brain_trend(pediatric_brain, ax=None, show=None):
     """
     Plot trend of mean pediatric brain tumor incidence by year.
     
@@ -62,27 +322,49 @@ def plot_pediatric_brain_trend(pediatric_brain):
     ----------
     pediatric_brain : DataFrame
         Pediatric brain tumor data with YEAR_NUM column.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
-    annual_brain_rates = (
-        pediatric_brain[pediatric_brain["YEAR_NUM"].notna()]
-        .groupby("YEAR_NUM")["AGE_ADJUSTED_RATE"]
-        .mean()
-        .reset_index()
-        .sort_values("YEAR_NUM")
-    )
-    
-    plt.figure(figsize=(6, 4))
-    plt.plot(annual_brain_rates["YEAR_NUM"], annual_brain_rates["AGE_ADJUSTED_RATE"], "-o")
-    plt.xlabel("Year")
-    plt.ylabel("Mean age-adjusted incidence rate (per 100,000)")
-    plt.title("Trend of mean pediatric malignant brain tumor incidence by year")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    _lazy_imports()
+    sub = pediatric_brain.dropna(subset=["YEAR_NUM"])
+    years = sub["YEAR_NUM"].to_numpy(np.int64)
+    rates = sub["AGE_ADJUSTED_RATE"].to_numpy(np.float64)
+    
+    # Per-year mean via bincount; NaN rates are skipped like groupby().mean()
+    if years.size == 0:
+        # No parseable years: draw empty axes, as groupby() did
+        xs = ys = np.empty(0)
+    else:
+        valid = ~np.isnan(rates)
+        y0 = years.min()
+        idx = years - y0
+        sums = np.bincount(idx, weights=np.where(valid, rates, 0.0))
+        counts = np.bincount(idx, weights=valid)
+        present = np.bincount(idx) > 0
+        xs = np.arange(y0, y0 + len(present))[present]
+        with np.errstate(invalid="ignore"):
+            ys = sums[present] / counts[present]
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(6, 4))
+    ax.plot(xs, ys, "-o")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Mean age-adjusted incidence rate (per 100,000)")
+    ax.set_title("Trend of mean pediatric malignant brain tumor incidence by year")
+    ax.grid(True)
+    return _finish_figure(fig, show, owns_fig)
 
 
 def plot_age_incidence_model(ages_emp, rates_emp, ages_model, rates_model, 
-                             target_year=2020, model_label="Model"):
+                             target_year=2020, model_label="Model", ax=None, show=None):
     """
     Plot empirical age-incidence curve vs model predictions.
     
@@ -100,22 +382,39 @@ def plot_age_incidence_model(ages_emp, rates_emp, ages_model, rates_model,
         Year for the plot title.
     model_label : str
         Label for the model curve.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
-    plt.figure(figsize=(10, 6))
-    plt.scatter(ages_emp, rates_emp, alpha=0.6, s=50, color='steelblue', 
-                label=f"Observed incidence {target_year}", zorder=2)
-    plt.plot(ages_model, rates_model, color="darkorange", linewidth=2.5, 
-             label=model_label, zorder=3)
-    plt.xlabel("Age (years)", fontsize=12)
-    plt.ylabel("Incidence rate (per 100,000)", fontsize=12)
-    plt.title(f"Age–Incidence Curve: Observed vs {model_label} ({target_year})", fontsize=14)
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    _lazy_imports()
+    ages_emp = np.asarray(ages_emp, dtype=np.float64)
+    rates_emp = np.asarray(rates_emp, dtype=np.float64)
+    ages_model = np.asarray(ages_model, dtype=np.float64)
+    rates_model = np.asarray(rates_model, dtype=np.float64)
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(10, 6))
+    ax.scatter(ages_emp, rates_emp, alpha=0.6, s=50, color='steelblue', 
+               label=f"Observed incidence {target_year}", zorder=2, rasterized=True)
+    ax.plot(ages_model, rates_model, color="darkorange", linewidth=2.5, 
+            label=model_label, zorder=3)
+    ax.set_xlabel("Age (years)", fontsize=12)
+    ax.set_ylabel("Incidence rate (per 100,000)", fontsize=12)
+    ax.set_title(f"Age–Incidence Curve: Observed vs {model_label} ({target_year})", fontsize=14)
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    return _finish_figure(fig, show, owns_fig)
 
 
-def plot_age_incidence_curve(ages, rates, target_year=2020, title_suffix=""):
+def plot_age_incidence_curve(ages, rates, target_year=2020, title_suffix="", ax=None, show=None,
+                             max_points=2000):
     """
     Plot age-specific incidence curve.
     
@@ -129,24 +428,41 @@ def plot_age_incidence_curve(ages, rates, target_year=2020, title_suffix=""):
         Year for the plot title.
     title_suffix : str
         Additional text for the title.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    max_points : int or None, default=2000
+        Longer series are downsampled (LTTB) to this many points before
+        drawing; None draws every point.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
-    plt.figure(figsize=(10, 6))
-    plt.scatter(ages, rates, alpha=0.7, s=50, color='steelblue', label=f'Observed incidence ({target_year})')
-    plt.plot(ages, rates, alpha=0.5, linewidth=1.5, color='steelblue')
-    plt.xlabel('Age (years)', fontsize=12)
-    plt.ylabel('Incidence rate (per 100,000)', fontsize=12)
+    _lazy_imports()
+    ages, rates = _downsample(ages, rates, max_points)
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(10, 6))
+    ax.scatter(ages, rates, alpha=0.7, s=50, color='steelblue', label=f'Observed incidence ({target_year})',
+               rasterized=True)
+    ax.plot(ages, rates, alpha=0.5, linewidth=1.5, color='steelblue')
+    ax.set_xlabel('Age (years)', fontsize=12)
+    ax.set_ylabel('Incidence rate (per 100,000)', fontsize=12)
     title = f'Age-Specific Cancer Incidence - All Sites Combined ({target_year})'
     if title_suffix:
         title += f" - {title_suffix}"
-    plt.title(title, fontsize=14)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    plt.show()
+    ax.set_title(title, fontsize=14)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+    return _finish_figure(fig, show, owns_fig)
 
 
 def plot_parameter_sensitivity(ages, rates_emp, model_class, param_name, param_values, 
-                               other_params=None, scale_to_max=None):
+                               other_params=None, scale_to_max=None, ax=None, show=None):
     """
     Plot sensitivity analysis for a model parameter.
     
@@ -166,37 +482,66 @@ def plot_parameter_sensitivity(ages, rates_emp, model_class, param_name, param_v
         Other model parameters to keep constant.
     scale_to_max : float, optional
         Maximum value to scale predictions to.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
     """
+    _lazy_imports()
     if other_params is None:
         other_params = {}
     
     if scale_to_max is None:
         scale_to_max = np.max(rates_emp)
     
-    colors = plt.cm.viridis(np.linspace(0, 1, len(param_values)))
+    colors = np.asarray(_cmap_colors("viridis", len(param_values)))
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(10, 6))
+    ax.scatter(ages, rates_emp, alpha=0.4, s=30, color='gray', 
+               label='Observed data', zorder=1, rasterized=True)
     
-    plt.figure(figsize=(10, 6))
-    plt.scatter(ages, rates_emp, alpha=0.4, s=30, color='gray', 
-                label='Observed data', zorder=1)
+    if hasattr(model_class, "predict_sweep"):
+        # Evaluate the whole sweep at once, then scale every curve to
+        # scale_to_max (all-zero curves stay zero, as in predict_scaled)
+        preds = model_class(**other_params).predict_sweep(ages, param_name, param_values)
+        peaks = preds.max(axis=1, keepdims=True)
+        preds *= np.divide(scale_to_max, peaks, out=np.zeros_like(peaks), where=peaks > 0)
+    elif hasattr(model_class, "set_param"):
+        # Reuse one model and write each curve into a preallocated row
+        model = model_class(**other_params)
+        preds = np.empty((len(param_values), np.size(ages)))
+        for i, param_val in enumerate(param_values):
+            model.set_param(param_name, param_val)
+            model.predict_scaled(ages, scale_to_max=scale_to_max, out=preds[i])
+    else:
+        preds = []
+        for param_val in param_values:
+            params = other_params.copy()
+            params[param_name] = param_val
+            model = model_class(**params)
+            preds.append(model.predict_scaled(ages, scale_to_max=scale_to_max))
     
-    for param_val, color in zip(param_values, colors):
-        params = other_params.copy()
-        params[param_name] = param_val
-        model = model_class(**params)
-        pred = model.predict_scaled(ages, scale_to_max=scale_to_max)
+    for param_val, color, pred in zip(param_values, colors, preds):
         label = f'{param_name} = {param_val:.2e}' if param_val < 1 else f'{param_name} = {param_val:,}'
-        plt.plot(ages, pred, linewidth=2, label=label, color=color, zorder=2)
-    
-    plt.xlabel('Age (years)', fontsize=12)
-    plt.ylabel('Incidence rate (per 100,000)', fontsize=12)
-    plt.title(f'Sensitivity Analysis: Effect of {param_name.upper()}', fontsize=14)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+        ax.plot(ages, pred, linewidth=2, label=label, color=color, zorder=2)
+    
+    ax.set_xlabel('Age (years)', fontsize=12)
+    ax.set_ylabel('Incidence rate (per 100,000)', fontsize=12)
+    ax.set_title(f'Sensitivity Analysis: Effect of {param_name.upper()}', fontsize=14)
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
+    return _finish_figure(fig, show, owns_fig)
 
 
-def plot_multi_year_comparison(all_sites_age_inc, years=[2015, 2018, 2020, 2022]):
+def plot_multi_year_comparison(all_sites_age_inc, years=[2015, 2018, 2020, 2022], ax=None, show=None,
+                               max_points=2000):
     """
     Plot age-incidence curves for multiple years.
     
@@ -205,30 +550,68 @@ def plot_multi_year_comparison(all_sites_age_inc, years=[2015, 2018, 2020, 2022]
     all_sites_age_inc : DataFrame
         Age-specific incidence data.
     years : list
-        List of years to plot.
-    """
-    from src.models import prepare_age_incidence_data
-    
-    plt.figure(figsize=(10, 6))
-    colors = plt.cm.tab10(np.linspace(0, 1, len(years)))
-    
-    for year, color in zip(years, colors):
-        try:
-            ages, rates = prepare_age_incidence_data(all_sites_age_inc, target_year=year)
-            plt.plot(ages, rates, linewidth=2, label=f'{year}', color=color, alpha=0.8)
-        except Exception as e:
-            print(f"Warning: Could not plot data for year {year}: {e}")
-    
-    plt.xlabel('Age (years)', fontsize=12)
-    plt.ylabel('Incidence rate (per 100,000)', fontsize=12)
-    plt.title('Age-Specific Cancer Incidence: Multi-Year Comparison', fontsize=14)
-    plt.legend(fontsize=11, title='Year')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+        List of years to plot. Years without data are skipped.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    max_points : int or None, default=2000
+        Longer series are downsampled (LTTB) to this many points before
+        drawing; None draws every point.
+    
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The figure that was drawn on, or None once it has been shown.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    from src.utils import age_group_to_mid_series
+    
+    _lazy_imports()
+    
+    # Select every requested year in one pass, then one stable sort by
+    # (year, age midpoint) leaves each year's curve as a contiguous run
+    df = all_sites_age_inc.loc[np.isin(all_sites_age_inc["YEAR"].to_numpy(), years)]
+    age_mid = age_group_to_mid_series(df["AGE"]).to_numpy()
+    valid = ~np.isnan(age_mid)
+    year_col = df["YEAR"].to_numpy(np.float64)[valid]
+    age_col = age_mid[valid]
+    rate_col = df["RATE"].to_numpy(np.float64)[valid]
+    order = np.lexsort((age_col, year_col))
+    year_col, age_col, rate_col = year_col[order], age_col[order], rate_col[order]
+    starts = np.searchsorted(year_col, years, side="left")
+    ends = np.searchsorted(year_col, years, side="right")
+    
+    owns_fig = ax is None
+    fig, ax = _get_ax(ax, figsize=(10, 6))
+    colors = np.asarray(_cmap_colors("tab10", len(years)))
+    
+    segments, seg_colors, handles = [], [], []
+    for year, color, lo, hi in zip(years, colors, starts, ends):
+        # Years without data are left out of the plot and the legend
+        if hi == lo:
+            continue
+        segments.append(np.column_stack(_downsample(age_col[lo:hi], rate_col[lo:hi], max_points)))
+        seg_colors.append(color)
+        handles.append(Line2D([], [], linewidth=2, color=color, alpha=0.8, label=f'{year}'))
+    
+    # Draw all years as a single artist; legend entries come from proxy lines
+    if segments:
+        ax.add_collection(LineCollection(segments, colors=seg_colors, linewidths=2, alpha=0.8))
+        ax.autoscale_view()
+    
+    ax.set_xlabel('Age (years)', fontsize=12)
+    ax.set_ylabel('Incidence rate (per 100,000)', fontsize=12)
+    ax.set_title('Age-Specific Cancer Incidence: Multi-Year Comparison', fontsize=14)
+    ax.legend(handles=handles, fontsize=11, title='Year')
+    ax.grid(True, alpha=0.3)
+    return _finish_figure(fig, show, owns_fig)
 
 
-def plot_residual_analysis(ages, rates_obs, rates_pred, model_label="Model"):
+def plot_residual_analysis(ages, rates_obs, rates_pred, model_label="Model", axes=None, show=None,
+                           max_points=2000):
     """
     Plot comprehensive residual analysis with improved visualization.
     
@@ -242,16 +625,46 @@ def plot_residual_analysis(ages, rates_obs, rates_pred, model_label="Model"):
         Predicted incidence rates.
     model_label : str
         Label for the model.
+    axes : sequence of two matplotlib.axes.Axes, optional
+        Axes for the fit and residual panels. A new figure is created when None.
+    show : bool, optional
+        Whether to display the figure. By default only figures created by
+        this function are shown.
+    max_points : int or None, default=2000
+        Longer series are downsampled (LTTB) to this many points before
+        drawing; None draws every point. Statistics always use all points.
+    
+    Returns
+    -------
+    dict
+        Fit statistics (mse, r2, mae, rmse), the residuals and, unless it
+        was shown, the figure under "fig".
     """
+    from matplotlib.colors import ListedColormap
+    from matplotlib.patches import Patch
+    
+    _lazy_imports()
+    ages = np.asarray(ages, dtype=np.float64)
+    rates_obs = np.asarray(rates_obs, dtype=np.float64)
+    rates_pred = np.asarray(rates_pred, dtype=np.float64)
     residuals = rates_obs - rates_pred
     
     # Create figure with two subplots
-    fig, axes = plt.subplots(2, 1, figsize=(12, 10))
+    owns_fig = axes is None
+    if owns_fig:
+        fig, axes = plt.subplots(2, 1, figsize=(12, 10))
+    else:
+        fig = axes[0].figure
+    
+    # One LTTB selection, driven by the residuals, for both panels so every
+    # drawn observation, prediction and residual belongs to the same ages
+    keep = _downsample_indices(ages, residuals, max_points)
+    ages_ds, residuals_ds = ages[keep], residuals[keep]
     
     # Top panel: Model fit comparison
-    axes[0].scatter(ages, rates_obs, alpha=0.6, s=50, color='steelblue', 
-                    label='Observed data', zorder=2)
-    axes[0].plot(ages, rates_pred, color='darkorange', linewidth=2.5, 
+    axes[0].scatter(ages_ds, rates_obs[keep], alpha=0.6, s=50, color='steelblue', 
+                    label='Observed data', zorder=2, rasterized=True)
+    axes[0].plot(ages_ds, rates_pred[keep], color='darkorange', linewidth=2.5, 
                  label=f'{model_label} prediction', zorder=3)
     axes[0].set_xlabel('Age (years)', fontsize=12)
     axes[0].set_ylabel('Incidence rate (per 100,000)', fontsize=12)
@@ -260,16 +673,15 @@ def plot_residual_analysis(ages, rates_obs, rates_pred, model_label="Model"):
     axes[0].grid(True, alpha=0.3)
     
     # Bottom panel: Residual plot with enhanced visualization
-    # Color code residuals: positive (underestimate) vs negative (overestimate)
-    positive_mask = residuals >= 0
-    negative_mask = residuals < 0
-    
-    axes[1].scatter(ages[positive_mask], residuals[positive_mask], 
-                    alpha=0.7, s=60, color='purple', 
-                    label='Model underestimates (predicted < observed)', zorder=2)
-    axes[1].scatter(ages[negative_mask], residuals[negative_mask], 
-                    alpha=0.7, s=60, color='red', 
-                    label='Model overestimates (predicted > observed)', zorder=2)
+    # Color code residuals: positive (underestimate) vs negative (overestimate),
+    # drawn as one scatter through a two-color map (0 = red, 1 = purple)
+    axes[1].scatter(ages_ds, residuals_ds, c=(residuals_ds >= 0).astype(np.int8),
+                    cmap=ListedColormap(_RESIDUAL_COLORS), vmin=0, vmax=1,
+                    alpha=0.7, s=60, zorder=2, rasterized=True)
+    sign_handles = [
+        Patch(color='purple', alpha=0.7, label='Model underestimates (predicted < observed)'),
+        Patch(color='red', alpha=0.7, label='Model overestimates (predicted > observed)'),
+    ]
     
     # Reference line at zero
     axes[1].axhline(y=0, color='black', linestyle='--', linewidth=2, 
@@ -278,32 +690,37 @@ def plot_residual_analysis(ages, rates_obs, rates_pred, model_label="Model"):
     # Add good fit zone (±10% of max rate as threshold)
     max_rate = np.max(rates_obs)
     threshold = 0.1 * max_rate
-    axes[1].fill_between([ages.min(), ages.max()], -threshold, threshold, 
-                         alpha=0.15, color='green', 
-                         label=f'Good fit zone (±{threshold:.0f})', zorder=0)
+    axes[1].axhspan(-threshold, threshold, alpha=0.15, color='green', 
+                    label=f'Good fit zone (±{threshold:.0f})', zorder=0)
     
     axes[1].set_xlabel('Age (years)', fontsize=12)
     axes[1].set_ylabel('Residuals (Observed - Predicted)', fontsize=12)
     axes[1].set_title('Residual Plot: Model Fit Quality Assessment', fontsize=14)
-    axes[1].legend(fontsize=10, loc='upper right')
+    ref_handles, _ = axes[1].get_legend_handles_labels()
+    axes[1].legend(handles=sign_handles + ref_handles, fontsize=10, loc='upper right')
     axes[1].grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.show()
-    
-    # Calculate and return statistics
-    from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+    fig = _finish_figure(fig, show, owns_fig)
     
-    mse = mean_squared_error(rates_obs, rates_pred)
-    r2 = r2_score(rates_obs, rates_pred)
-    mae = mean_absolute_error(rates_obs, rates_pred)
-    rmse = np.sqrt(mse)
+    # Calculate and return statistics from the residuals already computed
+    mse = float(np.mean(residuals ** 2))
+    mae = float(np.mean(np.abs(residuals)))
+    ss_res = float(np.sum(residuals ** 2))
+    ss_tot = float(np.sum((rates_obs - np.mean(rates_obs)) ** 2))
+    if ss_tot == 0:
+        # Constant observations: same convention as sklearn's r2_score
+        r2 = 1.0 if ss_res == 0 else 0.0
+    else:
+        # NaN in the inputs propagates to r2 like the other statistics
+        r2 = 1.0 - ss_res / ss_tot
+    rmse = float(np.sqrt(mse))
     
     return {
         'mse': mse,
         'r2': r2,
         'mae': mae,
         'rmse': rmse,
-        'residuals': residuals
+        'residuals': residuals,
+        'fig': fig,
     }
 
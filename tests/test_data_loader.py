@@ -0,0 +1,74 @@
+"""
+Tests for USCS data loading and aggregation helpers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import (
+    _sum_by_age_year,
+    build_byage_index,
+    get_site_age_incidence,
+    get_site_age_incidence_batch,
+)
+
+
+AGES = ["1-4", "5-9", "70-74", "85+", "All Ages"]
+
+
+def _by_age(years=(2019, 2020), seed=0):
+    """Small BYAGE-like frame: two sites, two sexes, one row per age group."""
+    rng = np.random.default_rng(seed)
+    rows = [
+        (event, "All Races", site, sex, year, age)
+        for event in ["Incidence", "Mortality"]
+        for site in ["Colon and Rectum", "Lung and Bronchus"]
+        for sex in ["Female", "Male"]
+        for year in years
+        for age in AGES
+    ]
+    df = pd.DataFrame(rows, columns=["EVENT_TYPE", "RACE", "SITE", "SEX", "YEAR", "AGE"])
+    df["COUNT"] = rng.integers(0, 500, len(df)).astype(np.float64)
+    df["POPULATION"] = rng.integers(10_000, 100_000, len(df)).astype(np.float64)
+    return df
+
+
+@pytest.mark.parametrize("year_dtype", [object, "string"])
+def test_site_age_incidence_text_year(year_dtype):
+    by_age = _by_age()
+    text = by_age.assign(YEAR=by_age["YEAR"].astype(str).astype(year_dtype))
+    
+    ages, rates, _ = get_site_age_incidence(by_age, "Colon and Rectum", 2020)
+    ages_text, rates_text, _ = get_site_age_incidence(text, "Colon and Rectum", 2020)
+    
+    assert len(ages) == len(AGES) - 1
+    np.testing.assert_array_equal(ages_text, ages)
+    np.testing.assert_allclose(rates_text, rates)
+    
+    batch = get_site_age_incidence_batch(text, ["Colon and Rectum"], 2020, n_jobs=1)
+    np.testing.assert_allclose(batch["Colon and Rectum"][1], rates)
+    
+    indexed = get_site_age_incidence(build_byage_index(text), "Colon and Rectum", 2020)
+    np.testing.assert_allclose(indexed[1], rates)
+
+
+@pytest.mark.parametrize("key_dtype", [object, "category"])
+def test_sum_by_age_year_matches_groupby(key_dtype):
+    df = _by_age(years=(2018, 2019, 2020), seed=1)
+    df.loc[::7, "COUNT"] = np.nan
+    df.loc[3, "AGE"] = None
+    df.loc[5, "YEAR"] = np.nan
+    df = df.astype({"AGE": key_dtype})
+    
+    result = _sum_by_age_year(df, ["COUNT", "POPULATION"])
+    expected = (
+        df.groupby(["AGE", "YEAR"], as_index=False, observed=True)[["COUNT", "POPULATION"]]
+        .sum()
+    )
+    
+    assert list(result.columns) == ["AGE", "YEAR", "COUNT", "POPULATION"]
+    np.testing.assert_array_equal(result["AGE"].astype(str), expected["AGE"].astype(str))
+    np.testing.assert_array_equal(result["YEAR"], expected["YEAR"])
+    np.testing.assert_allclose(result["COUNT"], expected["COUNT"])
+    np.testing.assert_allclose(result["POPULATION"], expected["POPULATION"])
@@ -0,0 +1,95 @@
+"""
+Tests for the mutation-accumulation model.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.models import MutationAccumulationModel
+
+
+AGES = np.arange(0.0, 90.0, 2.5)
+
+PARAMS = [
+    dict(p=2e-6, M=5000, divisions_per_year=2.5, C=1, r=0.0),
+    dict(p=5e-6, M=20000, divisions_per_year=3.0, C=1, r=0.3),
+    dict(p=1e-3, M=5000, divisions_per_year=2.5, C=2, r=0.0),
+    dict(p=2e-3, M=1000, divisions_per_year=4.0, C=3, r=0.1),
+]
+
+
+def _reference_predict(ages, p, M, divisions_per_year, C, r):
+    """Direct evaluation of the model formula, one age at a time."""
+    p_eff = p * (1 - r)
+    out = []
+    for a in ages:
+        n = int(a * divisions_per_year)
+        if C == 1:
+            p_cell = 1 - (1 - p_eff) ** (a * divisions_per_year)
+        elif C > n or n * p_eff < 1e-10:
+            p_cell = 0.0
+        else:
+            lam = n * p_eff
+            p_cell = 1 - sum(math.exp(-lam) * lam ** i / math.factorial(i) for i in range(C))
+        out.append(1 - (1 - p_cell) ** M)
+    return np.array(out)
+
+
+@pytest.mark.parametrize("params", PARAMS)
+def test_predict_matches_reference(params):
+    result = MutationAccumulationModel(**params).predict(AGES)
+    np.testing.assert_allclose(result, _reference_predict(AGES, **params), rtol=1e-6, atol=1e-15)
+
+
+def test_predict_returns_copy():
+    model = MutationAccumulationModel(**PARAMS[0])
+    first = model.predict(AGES)
+    expected = first.copy()
+    
+    first[:] = -1.0
+    
+    np.testing.assert_array_equal(model.predict(AGES), expected)
+    scaled = model.predict_scaled(AGES, scale_to_max=100.0)
+    assert scaled.max() == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize("name,value", [
+    ("p", 4e-6), ("M", 8000), ("divisions_per_year", 1.5), ("C", 2), ("r", 0.5),
+])
+def test_predict_cache_sees_parameter_changes(name, value):
+    model = MutationAccumulationModel(**PARAMS[0])
+    model.predict(AGES)
+    
+    setattr(model, name, value)
+    
+    expected = MutationAccumulationModel(**dict(PARAMS[0], **{name: value})).predict(AGES)
+    np.testing.assert_array_equal(model.predict(AGES), expected)
+
+
+@pytest.mark.parametrize("params,param_name,param_values", [
+    (PARAMS[0], "p", [1e-6, 2e-6, 5e-6]),
+    (PARAMS[1], "M", [1000, 5000, 20000]),
+    (PARAMS[1], "r", [0.0, 0.5, 0.9]),
+    (PARAMS[0], "C", [1, 2, 3]),
+    (PARAMS[2], "p", [5e-4, 1e-3, 2e-3]),
+    (PARAMS[3], "divisions_per_year", [2.0, 4.0]),
+])
+def test_predict_sweep_matches_one_model_per_value(params, param_name, param_values):
+    result = MutationAccumulationModel(**params).predict_sweep(AGES, param_name, param_values)
+    
+    expected = np.array([
+        MutationAccumulationModel(**dict(params, **{param_name: value})).predict(AGES)
+        for value in param_values
+    ])
+    assert result.shape == (len(param_values), AGES.size)
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=0)
+
+
+def test_predict_sweep_edge_cases():
+    model = MutationAccumulationModel(**PARAMS[0])
+    
+    assert model.predict_sweep(AGES, "p", []).shape == (0, AGES.size)
+    with pytest.raises(ValueError):
+        model.predict_sweep(AGES, "q", [1.0])
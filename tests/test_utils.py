@@ -0,0 +1,102 @@
+"""
+Tests for age group conversion utilities.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import (
+    age_group_to_mid,
+    age_group_to_mid_series,
+    age_group_to_start,
+    age_group_to_start_series,
+    select_age_curve,
+)
+
+
+AGE_GROUPS = [
+    "1-4", "70-74", "85+", " 85+", "All Ages", "invalid", "<1",
+    "1-4-5", "a-b", "x+", "0-19", "20+", None, np.nan,
+]
+
+
+def _same(result, expected):
+    if isinstance(expected, float) and math.isnan(expected):
+        return math.isnan(result)
+    return result == expected
+
+
+@pytest.mark.parametrize("age_str,expected", [
+    ("1-4", 1.0),
+    ("70-74", 70.0),
+    ("85+", 85.0),
+    (" 85+ ", 85.0),
+    ("0-19", 0.0),
+    ("All Ages", -1),
+    ("invalid", math.nan),
+    (None, math.nan),
+])
+def test_age_group_to_start(age_str, expected):
+    assert _same(age_group_to_start(age_str), expected)
+
+
+@pytest.mark.parametrize("age_str,expected", [
+    ("1-4", 2.5),
+    ("70-74", 72.0),
+    ("85+", 87.5),
+    (" 85+ ", 87.5),
+    ("0-19", 9.5),
+    ("All Ages", math.nan),
+    ("invalid", math.nan),
+    ("1-4-5", math.nan),
+    (None, math.nan),
+])
+def test_age_group_to_mid(age_str, expected):
+    assert _same(age_group_to_mid(age_str), expected)
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "category"])
+@pytest.mark.parametrize("series_func,scalar_func", [
+    (age_group_to_start_series, age_group_to_start),
+    (age_group_to_mid_series, age_group_to_mid),
+])
+def test_series_matches_scalar(dtype, series_func, scalar_func):
+    ages = pd.Series(AGE_GROUPS, index=range(10, 10 + len(AGE_GROUPS))).astype(dtype)
+    
+    result = series_func(ages)
+    expected = np.array([scalar_func(a) for a in ages.astype(object)], dtype="float64")
+    
+    assert result.dtype == np.float64
+    assert result.index.equals(ages.index)
+    np.testing.assert_array_equal(result.to_numpy(), expected)
+
+
+def test_series_empty():
+    assert age_group_to_start_series(pd.Series([], dtype=object)).empty
+    assert age_group_to_mid_series(pd.Series([], dtype="category")).empty
+
+
+@pytest.mark.parametrize("year_dtype", ["int64", object, "string"])
+def test_select_age_curve_year_dtypes(year_dtype):
+    df = pd.DataFrame({
+        "AGE": ["85+", "1-4", "All Ages", "70-74", "1-4"],
+        "YEAR": pd.Series([2020, 2020, 2020, 2020, 2019]).astype(year_dtype),
+        "RATE": [5.0, 1.0, 9.0, 4.0, 2.0],
+    })
+    
+    ages, rates, df_year = select_age_curve(df, 2020)
+    
+    np.testing.assert_array_equal(ages, [2.5, 72.0, 87.5])
+    np.testing.assert_array_equal(rates, [1.0, 4.0, 5.0])
+    assert len(df_year) == 3
+
+
+def test_select_age_curve_unparseable_year():
+    df = pd.DataFrame({"AGE": ["1-4", "5-9"], "YEAR": ["2020", "n/a"], "RATE": [1.0, 2.0]})
+    
+    ages, rates, _ = select_age_curve(df, 2020)
+    
+    np.testing.assert_array_equal(ages, [2.5])
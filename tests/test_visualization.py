@@ -0,0 +1,122 @@
+"""
+Tests for the plotting helpers.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from src.models import MutationAccumulationModel
+from src.visualization import (
+    _downsample_indices,
+    _lttb_indices,
+    plot_parameter_sensitivity,
+    plot_residual_analysis,
+)
+
+
+class _SettableModel:
+    """Model with set_param but no predict_sweep (the reuse-one-model path)."""
+    
+    def __init__(self, **params):
+        self._model = MutationAccumulationModel(**params)
+    
+    def set_param(self, name, value):
+        self._model.set_param(name, value)
+    
+    def predict_scaled(self, ages, scale_to_max=None, out=None):
+        return self._model.predict_scaled(ages, scale_to_max=scale_to_max, out=out)
+
+
+class _PlainModel:
+    """Model with predict_scaled only (one instance per value)."""
+    
+    def __init__(self, **params):
+        self._model = MutationAccumulationModel(**params)
+    
+    def predict_scaled(self, ages, scale_to_max=None):
+        return self._model.predict_scaled(ages, scale_to_max=scale_to_max)
+
+
+def test_residual_panels_share_downsampled_ages():
+    rng = np.random.default_rng(0)
+    ages = rng.permutation(np.linspace(0.0, 90.0, 500))
+    rates_obs = np.exp(ages / 15.0) + rng.normal(0.0, 5.0, ages.size)
+    rates_pred = np.exp(ages / 15.0)
+    
+    fig, axes = plt.subplots(2, 1)
+    plot_residual_analysis(ages, rates_obs, rates_pred, axes=axes, show=False, max_points=50)
+    
+    obs_xy = axes[0].collections[0].get_offsets()
+    pred_x, pred_y = axes[0].lines[0].get_data()
+    res_xy = axes[1].collections[0].get_offsets()
+    plt.close(fig)
+    
+    assert len(obs_xy) == len(res_xy) == len(pred_x) == 50
+    np.testing.assert_array_equal(obs_xy[:, 0], pred_x)
+    np.testing.assert_array_equal(res_xy[:, 0], pred_x)
+    np.testing.assert_allclose(res_xy[:, 1], obs_xy[:, 1] - pred_y)
+
+
+@pytest.mark.parametrize("max_points", [None, 2, 100])
+def test_downsample_indices_short_or_disabled(max_points):
+    x = np.arange(100.0)
+    assert _downsample_indices(x, x, max_points) == slice(None)
+
+
+def _sensitivity_curves(model_class, param_name, param_values, other_params):
+    ages = np.arange(0.0, 90.0, 5.0)
+    fig, ax = plt.subplots()
+    plot_parameter_sensitivity(ages, np.full(ages.size, 100.0), model_class, param_name,
+                               param_values, other_params=other_params, ax=ax, show=False)
+    curves = [line.get_ydata() for line in ax.lines]
+    plt.close(fig)
+    return np.array(curves)
+
+
+@pytest.mark.parametrize("param_name,param_values,other_params", [
+    ("p", [1e-6, 2e-6, 5e-6], {"M": 5000}),
+    ("M", [1000, 5000], {"p": 2e-6, "C": 2}),
+])
+def test_parameter_sensitivity_paths_agree(param_name, param_values, other_params):
+    expected = _sensitivity_curves(_PlainModel, param_name, param_values, other_params)
+    
+    for model_class in (_SettableModel, MutationAccumulationModel):
+        curves = _sensitivity_curves(model_class, param_name, param_values, other_params)
+        np.testing.assert_allclose(curves, expected, rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("n,max_points", [(10, 3), (101, 10), (1000, 37), (5000, 2000)])
+def test_lttb_indices(n, max_points):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.uniform(0.0, 90.0, n))
+    y = rng.normal(size=n).cumsum()
+    
+    idx = _lttb_indices(x, y, max_points)
+    
+    assert idx.shape == (max_points,)
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_indices_keeps_spike():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[500] = 100.0
+    
+    assert 500 in _lttb_indices(x, y, 20)
+
+
+def test_downsample_indices_sorts_unordered_x():
+    rng = np.random.default_rng(0)
+    x = rng.permutation(np.arange(300.0))
+    
+    keep = _downsample_indices(x, x ** 2, 30)
+    
+    assert len(keep) == 30
+    assert x[keep][0] == 0.0 and x[keep][-1] == 299.0
+    assert np.all(np.diff(x[keep]) > 0)